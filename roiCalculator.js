@@ -53,7 +53,4 @@ function initROICalculator() {
 
     // Initial calculation
     updateCalculations();
-}
-
-// Initialize when DOM is loaded
-document.addEventListener('DOMContentLoaded', initROICalculator);
\ No newline at end of file
+}
\ No newline at end of file